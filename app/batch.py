@@ -0,0 +1,248 @@
+import argparse
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+import multiprocessing
+from pathlib import Path
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.config import BASE_CONF, project_root
+from app.helpers import log
+from app.load_config import LoadConfig
+from app.pretalx import Pretalx
+
+
+class RateLimitedSession(requests.Session):
+    """
+    Session with a connection pool shared by all threads and a global limit of requests per second.
+    """
+
+    def __init__(self, requests_per_second: float, pool_maxsize: int):
+        """
+
+        :param requests_per_second: max. requests started per second across all threads, 0 or less disables the limit
+        :param pool_maxsize: connections kept open per host
+        """
+        super().__init__()
+        self.min_interval = 1 / requests_per_second if requests_per_second > 0 else 0
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
+        self._waited = threading.local()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+    def _wait_for_slot(self) -> float:
+        """reserves the next free slot under the lock, sleeps outside of it, returns the time slept"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+            return slot - now
+        return 0.0
+
+    @property
+    def waited(self) -> float:
+        """time the current thread has spent waiting for the rate limit"""
+        return getattr(self._waited, "total", 0.0)
+
+    def request(self, *args, **kwargs):
+        self._waited.total = self.waited + self._wait_for_slot()
+        return super().request(*args, **kwargs)
+
+
+@dataclass
+class ProjectTiming:
+    """Timing of one project in a batch run, in seconds"""
+
+    name: str
+    refresh: float = 0.0
+    post_process: float = 0.0
+    rate_limit_wait: float = 0.0
+    sections: dict = field(default_factory=dict)
+    error: str | None = None
+
+    @property
+    def total(self) -> float:
+        return self.refresh + self.post_process
+
+
+def discover_projects(projects_dir: Path | str | None = None, names: list | None = None) -> list[LoadConfig]:
+    """
+    Finds all projects following the conventions, i.e. projects/project_dir/config.yml
+    :param projects_dir: directory containing the projects, defaults to batch.projects_dir in config
+    :param names: optional project directory names to restrict to, unknown names raise a ValueError
+    :return: loaded configs of all projects found
+    """
+    projects_dir = Path(projects_dir) if projects_dir else project_root / BASE_CONF.batch.projects_dir
+    log.debug(f"discovering projects in {projects_dir}")
+    if not projects_dir.is_dir():
+        msg = f"the projects directory {projects_dir} could not be located, please follow the conventions"
+        log.debug(msg)
+        raise NotADirectoryError(f"{msg} -  see set-up.")
+    project_dirs = sorted(x for x in projects_dir.iterdir() if x.is_dir())
+    unknown = sorted(set(names or []) - {x.name for x in project_dirs})
+    if unknown:
+        raise ValueError(f"unknown projects {', '.join(unknown)} in {projects_dir}")
+    projects = []
+    for project_dir in project_dirs:
+        if names and project_dir.name not in names:
+            continue
+        try:
+            projects.append(LoadConfig(None, project_dir=project_dir.resolve()))
+        except (FileNotFoundError, NotADirectoryError, ValueError) as e:
+            log.info(f"skipping {project_dir.name}: {e}")
+    log.info(f"discovered {len(projects)} projects", projects=[x.project_dir.name for x in projects])
+    return projects
+
+
+def _timed_refresh(section, session: RateLimitedSession) -> tuple[float, float]:
+    """refreshes a section, returns the duration excluding rate limit waits and the time waited"""
+    start = time.perf_counter()
+    waited = session.waited
+    section.refresh()
+    waited = session.waited - waited
+    return time.perf_counter() - start - waited, waited
+
+
+def _timed_post_process(project_config_path: str, project_dir: str) -> float:
+    """
+    Runs in a worker process: loads the saved data from disk and post-processes it,
+    a missing file raises instead of falling back to the API outside of the shared session
+    :return: duration
+    """
+    start = time.perf_counter()
+    p = Pretalx(project_config_path, project_dir)
+    for section in p.api_sections:
+        getattr(p, section).load()
+    p.post_process()
+    return time.perf_counter() - start
+
+
+def refresh_projects(
+    projects: list[LoadConfig],
+    max_workers: int | None = None,
+    requests_per_second: float | None = None,
+    max_processes: int | None = None,
+) -> list[ProjectTiming]:
+    """
+    Refreshes all projects' API sections concurrently over one shared session,
+    each project is post-processed in a process pool as soon as all of its sections are loaded.
+    :param projects: as returned by discover_projects
+    :param max_workers: threads for API calls, defaults to batch.max_workers in config
+    :param requests_per_second: global rate limit, defaults to batch.requests_per_second in config
+    :param max_processes: processes for post-processing, defaults to batch.max_processes in config
+    :return: timings per project
+    """
+    if not projects:
+        log.info("no projects to refresh")
+        return []
+    conf = BASE_CONF.batch
+    max_workers = conf.max_workers if max_workers is None else max_workers
+    requests_per_second = conf.requests_per_second if requests_per_second is None else requests_per_second
+    max_processes = conf.max_processes if max_processes is None else max_processes
+
+    timings = {x.project_dir.name: ProjectTiming(x.project_dir.name) for x in projects}
+    pending = defaultdict(int)
+    submitted = {}
+    post_futures = {}
+
+    # forking while refresh threads hold locks (e.g. the logger's) would deadlock the workers
+    mp_context = multiprocessing.get_context("spawn")
+    with RateLimitedSession(requests_per_second, max_workers) as session, ThreadPoolExecutor(
+        max_workers
+    ) as threads, ProcessPoolExecutor(max_processes, mp_context=mp_context) as processes:
+        refresh_futures = {}
+        projects_by_name = {}
+        for project in projects:
+            name = project.project_dir.name
+            projects_by_name[name] = project
+            p = Pretalx(project.project_config_path, project.project_dir, session=session)
+            submitted[name] = time.perf_counter()
+            for section in p.api_sections:
+                refresh_futures[threads.submit(_timed_refresh, getattr(p, section), session)] = (name, section)
+                pending[name] += 1
+
+        for future in as_completed(refresh_futures):
+            name, section = refresh_futures[future]
+            timing = timings[name]
+            pending[name] -= 1
+            try:
+                timing.sections[section], waited = future.result()
+                timing.rate_limit_wait += waited
+            except Exception as e:
+                log.exception(f"refreshing {section} of {name} failed")
+                timing.error = f"{section}: {e}"
+            if pending[name]:
+                continue
+            # includes time queued behind other projects' sections, the pool is shared
+            timing.refresh = time.perf_counter() - submitted[name]
+            if timing.error:
+                continue
+            project = projects_by_name[name]
+            future = processes.submit(_timed_post_process, str(project.project_config_path), str(project.project_dir))
+            post_futures[future] = name
+
+        for future in as_completed(post_futures):
+            name = post_futures[future]
+            try:
+                timings[name].post_process = future.result()
+            except Exception as e:
+                log.exception(f"post-processing {name} failed")
+                timings[name].error = f"post-processing: {e}"
+
+    return list(timings.values())
+
+
+def log_timing_report(timings: list[ProjectTiming], wall_time: float):
+    """
+    Logs timings per project and compares the batch's wall time to running all projects one after another
+    :param timings: as returned by refresh_projects
+    :param wall_time: duration of the whole batch run
+    """
+    for timing in timings:
+        log.info(
+            f"timing {timing.name}",
+            refresh=f"{timing.refresh:.2f}s",
+            post_process=f"{timing.post_process:.2f}s",
+            total=f"{timing.total:.2f}s",
+            rate_limit_wait=f"{timing.rate_limit_wait:.2f}s",
+            slowest_section=max(timing.sections, key=timing.sections.get, default=None),
+            error=timing.error,
+        )
+    # serial estimate: every section and post-processing one after another, as each project's main.py does,
+    # without the time spent waiting for the rate limit, a serial run is not throttled
+    serial = sum(sum(x.sections.values()) + x.post_process for x in timings)
+    log.info(
+        f"refreshed {len(timings)} projects",
+        wall_time=f"{wall_time:.2f}s",
+        serial_estimate=f"{serial:.2f}s",
+        rate_limit_wait=f"{sum(x.rate_limit_wait for x in timings):.2f}s",
+        speedup=f"{serial / wall_time:.1f}x" if wall_time else None,
+        failed=[x.name for x in timings if x.error],
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Refresh all projects from pretalx at once")
+    parser.add_argument("projects", nargs="*", help="project directory names, default: all projects")
+    parser.add_argument("--max-workers", type=int, default=None, help="threads for API calls")
+    parser.add_argument("--requests-per-second", type=float, default=None, help="global rate limit")
+    parser.add_argument("--max-processes", type=int, default=None, help="processes for post-processing")
+    args = parser.parse_args()
+
+    log.info("launching batch")
+    start = time.perf_counter()
+    results = refresh_projects(
+        discover_projects(names=args.projects),
+        max_workers=args.max_workers,
+        requests_per_second=args.requests_per_second,
+        max_processes=args.max_processes,
+    )
+    log_timing_report(results, time.perf_counter() - start)
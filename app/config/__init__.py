@@ -8,9 +8,9 @@ this_module = Path(__file__).parent
 
 BASE_CONF = OmegaConf.load(this_module / "config.yml")
 
-BASE_CONF["pretalx"]["token"] = (
-    (project_root / BASE_CONF.pretalx.token_dir / BASE_CONF.pretalx.token_file_name).open().read()
-)
+pretalx_token = project_root / BASE_CONF.pretalx.token_dir / BASE_CONF.pretalx.token_file_name
+if pretalx_token.exists():
+    BASE_CONF["pretalx"]["token"] = pretalx_token.open().read()
 
 if BASE_CONF.dropbox:
     dropbox_token = project_root / BASE_CONF.pretalx.token_dir / BASE_CONF.dropbox.token_file_name
@@ -17,15 +17,22 @@ class PretalxAPI:
     Interface to provide the URLs and access headers for pretalx.
     """
 
-    def __init__(self, section_name: str, project_config: omegaconf.dictconfig.DictConfig):
+    def __init__(
+        self,
+        section_name: str,
+        project_config: omegaconf.dictconfig.DictConfig,
+        session: requests.Session | None = None,
+    ):
         """
 
         :param section_name: API section, e.g. submissions
         :param project_config: config loaded as in Pretalx class
+        :param session: optional shared session (connection pool), defaults to plain `requests` calls
         """
         log.debug(f"launching {self.__class__.__name__} with param", section_name=section_name)
         self.config = project_config
         self.section_name = section_name
+        self.session = requests if session is None else session
         log.debug(f"loaded config for {self.section_name} in {self.__class__.__name__}")
 
     def _url_constructor(self, ep):
@@ -57,7 +64,7 @@ class PretalxAPI:
         )
         if not params:
             params = {}
-        res = requests.get(url, headers=self.pretalx_headers, params=params)
+        res = self.session.get(url, headers=self.pretalx_headers, params=params)
         res_json = res.json()
         log.debug(
             f"loaded {self.section_name}{'' if call_no is None else f' #' + str(call_no)} data from pretalx API with params",
@@ -89,12 +96,19 @@ class Section:
     Handle API sections, i.e. submissions, speakers,…
     """
 
-    def __init__(self, section_name: str, config: omegaconf.dictconfig.DictConfig, project_dir: Path):
+    def __init__(
+        self,
+        section_name: str,
+        config: omegaconf.dictconfig.DictConfig,
+        project_dir: Path,
+        session: requests.Session | None = None,
+    ):
         """
 
         :param section_name: name of the section, must be in config
         :param config: config node for section
         :param project_dir:
+        :param session: optional shared session passed on to the API
         """
         self.config = config[section_name]
         self.section_name = section_name
@@ -102,7 +116,7 @@ class Section:
         self._data = []
         self._processed_data = []
 
-        self.api = PretalxAPI(section_name, config)
+        self.api = PretalxAPI(section_name, config, session)
 
     def load(self):
         with self._to_full_path(self.config.raw_path).open("r") as f:
@@ -121,9 +135,10 @@ class Section:
             json.dump(self._processed_data, f, indent=4)
 
     def refresh(self):
+        # do not use setter here, might result in endless recursion
         self._data = self.api.get_all_data_from_pretalx(self.api.url)
-        if self._data:  # do not use setter here, might result in endless recursion
-            self.save_to_json()
+        # save empty results as well, otherwise `data` falls back to the API on every access
+        self.save_to_json()
 
     def _to_full_path(self, fpath) -> Path:
         """helper returning a full Path to the file"""
@@ -169,11 +184,17 @@ class Section:
 
 
 class Pretalx:
-    def __init__(self, project_config_path: Path | str | None = None, project_dir: Path | str | None = None):
+    def __init__(
+        self,
+        project_config_path: Path | str | None = None,
+        project_dir: Path | str | None = None,
+        session: requests.Session | None = None,
+    ):
         """
 
         :param project_config_path: explicit Path otherwise it will be located following conventions automatically
         :param project_dir: explicit Path or otherwise it will be located following conventions automatically
+        :param session: optional session shared by all sections, e.g. to share a connection pool across projects
         """
         self.caller = inspect.stack()[1]  # module calling
         config = LoadConfig(self.caller, project_config_path, project_dir)
@@ -198,7 +219,7 @@ class Pretalx:
         self.questions: Section | None = None
 
         for section in self.api_sections:
-            setattr(self, section, Section(section, self.config, self.project_dir).init)
+            setattr(self, section, Section(section, self.config, self.project_dir, session).init)
 
     def _create_working_dirs(self):
         """
@@ -261,9 +282,17 @@ class Pretalx:
         for section in self.api_sections:
             getattr(self, section).refresh()
 
-        self.save_track_names_to_file()
-        self.save_submission_states_to_file()
-        self.save_submission_types_to_file()
+        self.post_process()
+
+    def post_process(self):
+        """
+        Derive files from the data already loaded/saved, sections never loaded fall back to the API
+        :return:
+        """
+        submissions = PretalxSubmissions(self)
+        submissions.save_track_names_to_file()
+        submissions.save_submission_states_to_file()
+        submissions.save_submission_types_to_file()
         self.save_questions_to_yaml()
 
 
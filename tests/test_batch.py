@@ -0,0 +1,107 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app import batch
+from app.pretalx import PretalxAPI, Section
+
+
+class FakeTime:
+    """clock advancing only when sleeping"""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def projects_dir(tmp_path):
+    projects = tmp_path / "projects"
+    for name in ("conf-a", "conf-b"):
+        (projects / name).mkdir(parents=True)
+        (projects / name / "config.yml").write_text(f"name: {name}\npretalx_event_slug: {name}\n")
+    (projects / "no-config").mkdir()
+    return projects
+
+
+def test_wait_for_slot_spaces_requests(monkeypatch):
+    fake_time = FakeTime()
+    monkeypatch.setattr(batch, "time", fake_time)
+    session = batch.RateLimitedSession(requests_per_second=4, pool_maxsize=1)
+
+    waits = [session._wait_for_slot() for _ in range(3)]
+
+    assert waits == [0.0, 0.25, 0.25]
+    assert fake_time.sleeps == [0.25, 0.25]
+
+
+def test_wait_for_slot_without_limit(monkeypatch):
+    fake_time = FakeTime()
+    monkeypatch.setattr(batch, "time", fake_time)
+    session = batch.RateLimitedSession(requests_per_second=0, pool_maxsize=1)
+
+    assert [session._wait_for_slot() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert not fake_time.sleeps
+
+
+def test_discover_projects_skips_dirs_without_config(projects_dir):
+    projects = batch.discover_projects(projects_dir)
+
+    assert [x.project_dir.name for x in projects] == ["conf-a", "conf-b"]
+    assert projects[0].config.pretalx_event_slug == "conf-a"
+
+
+def test_discover_projects_by_name(projects_dir):
+    projects = batch.discover_projects(projects_dir, names=["conf-b"])
+
+    assert [x.project_dir.name for x in projects] == ["conf-b"]
+
+
+def test_discover_projects_unknown_name(projects_dir):
+    with pytest.raises(ValueError, match="conf-c"):
+        batch.discover_projects(projects_dir, names=["conf-a", "conf-c"])
+
+
+def test_discover_projects_missing_dir(tmp_path):
+    with pytest.raises(NotADirectoryError):
+        batch.discover_projects(tmp_path / "projects")
+
+
+def test_refresh_projects_skips_post_processing_of_failed_project(projects_dir, monkeypatch):
+    def refresh(section):
+        if section.project_root.name == "conf-a" and section.section_name == "reviews":
+            raise ConnectionError("pretalx unavailable")
+
+    post_processed = []
+    monkeypatch.setattr(Section, "refresh", refresh)
+    monkeypatch.setattr(batch, "ProcessPoolExecutor", lambda max_workers, mp_context: ThreadPoolExecutor(max_workers))
+    monkeypatch.setattr(batch, "_timed_post_process", lambda _, project_dir: post_processed.append(project_dir) or 0.5)
+
+    timings = batch.refresh_projects(batch.discover_projects(projects_dir), max_workers=2, requests_per_second=0)
+
+    timings = {x.name: x for x in timings}
+    assert post_processed == [str(projects_dir / "conf-b")]
+    assert timings["conf-a"].error.startswith("reviews")
+    assert timings["conf-a"].post_process == 0.0
+    assert timings["conf-b"].error is None
+    assert timings["conf-b"].post_process == 0.5
+    assert set(timings["conf-b"].sections) == set(timings["conf-a"].sections) | {"reviews"}
+    assert [x.name for x in timings.values() if x.error] == ["conf-a"]
+
+
+def test_post_process_does_not_call_api_for_missing_files(projects_dir, monkeypatch):
+    def get_all_data_from_pretalx(*args, **kwargs):
+        raise AssertionError("post-processing must not call the API")
+
+    monkeypatch.setattr(PretalxAPI, "get_all_data_from_pretalx", get_all_data_from_pretalx)
+    project_dir = projects_dir / "conf-a"
+
+    with pytest.raises(FileNotFoundError):
+        batch._timed_post_process(str(project_dir / "config.yml"), str(project_dir))